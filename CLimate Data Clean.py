@@ -1,45 +1,45 @@
+import h5netcdf
+import logging
 import xarray as xr
 import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
 
 # Define the directory to search
 search_directory = "Base Climate Data"
 
-# Find all NetCDF files in the directory
-all_files = [
-    f for f in os.listdir(search_directory)
-    if f.endswith(".nc")
-]
+# Time steps per dask block when reading (one step is about 1 MB of float32)
+TIME_CHUNK = 12
 
-# Extract unique prefixes based on the first part of the file name
-prefixes = set(f.split("_")[0] for f in all_files)
 
-# Group files by their prefix
-files_by_prefix = defaultdict(list)
-for f in all_files:
-    prefix = f.split("_")[0]
-    files_by_prefix[prefix].append(os.path.join(search_directory, f))
+def process_prefix(prefix, file_paths):
+    """Combine the files of one prefix group and return the output path and metadata"""
+    # Open all files of the group in one go; dask reads and decodes them in
+    # parallel and concatenates lazily along the time dimension
+    combined_data = xr.open_mfdataset(
+        file_paths,
+        combine="nested",
+        concat_dim="time",
+        parallel=True,
+        chunks={"time": TIME_CHUNK},
+        engine="h5netcdf"
+    )
 
-# Process each group of files
-for prefix, file_paths in files_by_prefix.items():
-    datasets = []
+    # Extract the variable names and attributes from each file header only,
+    # skipping the dimension coordinates (time, lat, lon)
     data_names = []
-    
     for fp in file_paths:
-        dataset = xr.open_dataset(fp)
-        datasets.append(dataset)
-        
-        # Extract the variable names and attributes
-        for var_name in dataset.data_vars:
-            var_attrs = dataset[var_name].attrs
-            data_names.append({
-                "file_name": os.path.basename(fp),
-                "variable_name": var_name,
-                "attributes": var_attrs
-            })
-    
-    # Concatenate datasets along the time dimension
-    combined_data = xr.concat(datasets, dim="time")
+        with h5netcdf.File(fp, "r") as nc:
+            for var_name, var in nc.variables.items():
+                if var_name in nc.dimensions:
+                    continue
+                data_names.append({
+                    "file_name": os.path.basename(fp),
+                    "variable_name": var_name,
+                    "attributes": dict(var.attrs)
+                })
     
     # Determine the name for the output file based on the prefix and variable name
     if data_names:
@@ -48,11 +48,52 @@ for prefix, file_paths in files_by_prefix.items():
     else:
         output_path = f"/src/data/Processed Climate Data/combined_{prefix}_climate_data.nc"
     
+    # Compress the climate variables, starting from their source encoding so the
+    # -999 fill values survive the rewrite. On disk each chunk holds one time
+    # step like the source files, so reading one step decompresses only that
+    # step; every dask block covers whole disk chunks, so nothing is rewritten
+    encoding = {}
+    for var_name, var in combined_data.data_vars.items():
+        if var.dtype.kind != "f":
+            continue
+        encoding[var_name] = {
+            key: var.encoding[key]
+            for key in ("_FillValue", "missing_value", "dtype")
+            if key in var.encoding
+        }
+        encoding[var_name].update(zlib=True, complevel=4)
+        if "time" in var.dims:
+            encoding[var_name]["chunksizes"] = tuple(
+                1 if dim == "time" else size for dim, size in zip(var.dims, var.shape)
+            )
+
     # Save the combined dataset to a new NetCDF file
-    combined_data.to_netcdf(output_path)
-    
-    # Output metadata information for review
-    print(f"Combined dataset for prefix '{prefix}' saved to:", output_path)
-    print("Extracted Metadata:")
-    for entry in data_names:
-        print(entry)
+    combined_data.to_netcdf(output_path, encoding=encoding, engine="h5netcdf")
+    combined_data.close()
+
+    return output_path, data_names
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # Group the NetCDF files in the directory by the first part of their name
+    files_by_prefix = defaultdict(list)
+    for f in os.listdir(search_directory):
+        if not f.endswith(".nc"):
+            continue
+        files_by_prefix[f.partition("_")[0]].append(os.path.join(search_directory, f))
+
+    # Process the groups in parallel, one process per prefix; each process
+    # still uses dask threads for its own file reads
+    max_workers = max(1, min(len(files_by_prefix), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(process_prefix, files_by_prefix.keys(), files_by_prefix.values())
+
+        for prefix, (output_path, data_names) in zip(files_by_prefix, results):
+            # Output metadata information for review (run with DEBUG to list it)
+            logger.info("Combined dataset for prefix '%s' saved to: %s", prefix, output_path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Extracted Metadata:")
+                for entry in data_names:
+                    logger.debug("%s", entry)
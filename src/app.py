@@ -1,21 +1,8 @@
 # app.py
 
-import dash
-import dash_bootstrap_components as dbc
-from dash import html
-from components.navbar import Sidebar
+from dash_factory import create_app
 
-app = dash.Dash(
-    __name__, 
-    use_pages=True, 
-    external_stylesheets=[dbc.themes.SLATE]  # Use the SLATE theme
-)
-
-# Include the sidebar in the main layout
-app.layout = html.Div([
-    Sidebar(),          # The fixed navbar
-    dash.page_container  # Container for page content
-])
+app = create_app()  # Uses the SLATE theme
 
 server = app.server  # Expose the server variable for deployments
 
@@ -1,7 +1,10 @@
 # components/navbar.py
+from functools import lru_cache
+
 import dash_bootstrap_components as dbc
 from dash import html
 
+@lru_cache(maxsize=1)
 def Sidebar():
     sidebar = html.Div(
         [
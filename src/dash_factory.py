@@ -0,0 +1,33 @@
+# dash_factory.py
+
+import dash
+import dash_bootstrap_components as dbc
+from dash import html
+from flask import request
+from components.navbar import Sidebar
+
+def create_app(theme=dbc.themes.SLATE):
+    """Create the Dash app shared by the app.py and index.py entrypoints"""
+    app = dash.Dash(
+        __name__,
+        use_pages=True,
+        external_stylesheets=[theme],
+        compress=True  # Gzip layouts, callback responses and assets
+    )
+
+    # Include the sidebar in the main layout
+    app.layout = html.Div([
+        Sidebar(),          # The fixed navbar
+        dash.page_container  # Container for page content
+    ])
+
+    @app.server.after_request
+    def add_cache_headers(response):
+        # GeoJSON/JSON files under assets/ do not change at runtime, so let
+        # browsers keep them instead of refetching on every page load
+        if (request.path.startswith(app.get_asset_url(''))
+                and request.path.endswith(('.geojson', '.json'))):
+            response.headers['Cache-Control'] = 'public, max-age=86400'
+        return response
+
+    return app
@@ -1,14 +1,7 @@
-import dash
 import dash_bootstrap_components as dbc
-from dash import html, dcc
-from components.navbar import Sidebar
+from dash_factory import create_app
 
-app = dash.Dash(__name__, use_pages=True, external_stylesheets=[dbc.themes.BOOTSTRAP])
-
-app.layout = html.Div([
-    Sidebar(),
-    dash.page_container
-])
+app = create_app(theme=dbc.themes.BOOTSTRAP)
 
 if __name__ == '__main__':
     app.run_server(debug=True)
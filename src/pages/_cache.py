@@ -0,0 +1,34 @@
+# pages/_cache.py
+# Disk cache helpers shared by the pages
+
+import contextlib
+import os
+import tempfile
+
+# Processed page data is cached here between runs
+CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', '.cache'))
+
+
+def cache_is_fresh(cache_paths, source_paths):
+    """Return whether every cache file exists and is newer than all of its sources"""
+    if not all(os.path.exists(path) for path in cache_paths):
+        return False
+    source_mtime = max(os.path.getmtime(path) for path in source_paths)
+    return min(os.path.getmtime(path) for path in cache_paths) >= source_mtime
+
+
+def write_cache_file(path, write):
+    """Call write(tmp_path) on a temporary file next to path, then move it into place"""
+    # os.replace is atomic, so a killed process, a full disk or two workers
+    # writing at once can never leave a partial file at the cache path
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
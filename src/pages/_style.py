@@ -0,0 +1,26 @@
+# pages/_style.py
+# Styles shared by the pages
+
+from types import MappingProxyType
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Container style configurations, read-only so a page cannot change it for the others
+CONTAINER_STYLE = MappingProxyType({
+    'maxWidth': '2000px',      # Maximum width for very large screens
+    'minWidth': '320px',       # Minimum width for mobile screens
+    'margin': 'auto',
+    'color': '#ffffff',        # Text color for dark aesthetic
+    'marginTop': '56px',       # Add margin to account for fixed navbar
+    'paddingTop': '20px'       # Additional padding for spacing
+})
+
+# Dark card styling shared by the page figures, built once on top of Plotly's default
+# template. Graph objects can refer to it by name; plain-dict figures embed the object
+DARK_CARD_TEMPLATE = go.layout.Template(pio.templates['plotly'])
+DARK_CARD_TEMPLATE.layout.update(
+    paper_bgcolor='#272b30',
+    plot_bgcolor='#272b30',
+    font={'color': '#ffffff'}
+)
+pio.templates['dark_card'] = DARK_CARD_TEMPLATE
@@ -1,29 +1,59 @@
 # pages/home.py
 
+import calendar
 import dash
+import logging
 import os
+from functools import lru_cache
 from dash import html, dcc, callback, Input, Output
-import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import plotly.subplots as sp
-from statsmodels.tsa.seasonal import seasonal_decompose
 import pandas as pd
-from datetime import datetime
 import dash_bootstrap_components as dbc
 import numpy as np
+from pages._cache import CACHE_DIR, cache_is_fresh, write_cache_file
+from pages._style import CONTAINER_STYLE
+
+logger = logging.getLogger(__name__)
 
 def load_and_process_data():
     """Load and process cocoa production and price data"""
     # Get data directory path
     DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 
+    # This module is a source too, so edits to the processing invalidate the cache
+    source_files = [
+        os.path.join(DATA_DIR, 'cocoa-data.csv'),
+        os.path.join(DATA_DIR, 'Daily Prices.csv'),
+        __file__
+    ]
+    cache_files = [
+        os.path.join(CACHE_DIR, 'cocoa.feather'),
+        os.path.join(CACHE_DIR, 'futures.feather'),
+        os.path.join(CACHE_DIR, 'daily.feather')
+    ]
+
+    # Reuse the Feather cache while it is newer than all of its sources; an
+    # unreadable cache is only a miss, so it is rebuilt instead of failing the app
+    if cache_is_fresh(cache_files, source_files):
+        try:
+            return tuple(pd.read_feather(path) for path in cache_files)
+        except Exception as e:
+            logger.warning("Ignoring unreadable data cache: %s", e)
+
     try:
-        # Read production data
-        cocoa_df = pd.read_csv(os.path.join(DATA_DIR, 'cocoa-data.csv'))
+        price_columns = [
+            'London futures (£ sterling/tonne)',
+            'New York futures (US$/tonne)',
+            'ICCO daily price (US$/tonne)'
+        ]
 
-        # Read and parse futures data
-        futures_df = pd.read_csv(os.path.join(DATA_DIR, 'Daily Prices.csv'))
-        futures_df['Date'] = pd.to_datetime(futures_df['Date'], format='%d/%m/%Y')
+        # Read production data
+        cocoa_df = pd.read_csv(
+            os.path.join(DATA_DIR, 'cocoa-data.csv'),
+            dtype={'season': 'int32', 'production': 'float32', 'estimates': 'float32'},
+            engine='c'
+        )
 
         # Create consistent date range
         dates_range = pd.date_range(
@@ -32,50 +62,57 @@ def load_and_process_data():
             freq='D'
         )
 
-        # Map production and estimates to daily data
-        production_dict = dict(zip(cocoa_df['season'], cocoa_df['production']))
-        estimates_dict = dict(zip(cocoa_df['season'], cocoa_df['estimates']))
+        # Read and parse futures data in chunks, keeping only the analysis
+        # period from each; explicit dtypes skip type inference and the C
+        # parser handles the dates and thousands separators while reading
+        futures_chunks = pd.read_csv(
+            os.path.join(DATA_DIR, 'Daily Prices.csv'),
+            usecols=['Date'] + price_columns,
+            dtype={col: 'float64' for col in price_columns},
+            parse_dates=['Date'],
+            date_format='%d/%m/%Y',
+            thousands=',',
+            engine='c',
+            chunksize=50000
+        )
+        with futures_chunks:
+            futures_df = pd.concat(
+                [
+                    chunk[(chunk['Date'] >= dates_range[0]) & (chunk['Date'] <= dates_range[-1])]
+                    for chunk in futures_chunks
+                ],
+                ignore_index=True
+            )
 
+        # Map production and estimates to daily data with one join on the year
         daily_production = pd.DataFrame({
             'date': dates_range,
-            'production': [production_dict.get(year, None) for year in dates_range.year],
-            'estimates': [estimates_dict.get(year, None) for year in dates_range.year]
-        })
-
-        # Filter and clean futures data
-        futures_df = futures_df[futures_df['Date'].isin(dates_range)]
-        price_columns = [
-            'London futures (£ sterling/tonne)',
-            'New York futures (US$/tonne)',
-            'ICCO daily price (US$/tonne)'
-        ]
-        
-        for col in price_columns:
-            futures_df[col] = pd.to_numeric(
-                futures_df[col].astype(str).str.replace(',', ''),
-                errors='coerce'
-            )
+            'year': dates_range.year
+        }).merge(
+            cocoa_df[['season', 'production', 'estimates']].rename(columns={'season': 'year'}),
+            on='year',
+            how='left'
+        )[['date', 'production', 'estimates']]
+
+        # Write the processed frames to the cache for the next start; the cache
+        # is optional, so any failure (including a missing pyarrow) is only logged
+        try:
+            for df, path in zip((cocoa_df, futures_df, daily_production), cache_files):
+                write_cache_file(path, df.to_feather)
+        except Exception as e:
+            logger.warning("Could not write data cache: %s", e)
 
         return cocoa_df, futures_df, daily_production
 
-    except Exception as e:
-        print(f"Error loading data: {str(e)}")
-        return None, None, None
+    except (OSError, ValueError):
+        # Missing files and parse/dtype errors (pd.errors.ParserError is a
+        # ValueError) stop the app at import instead of breaking every callback
+        logger.exception("Error loading data from %s", DATA_DIR)
+        raise
 
 # Register the page
 dash.register_page(__name__, path='/')
 
-# Update the container style
-# Container style configurations
-CONTAINER_STYLE = {
-    'maxWidth': '2000px',      # Maximum width for very large screens
-    'minWidth': '320px',       # Minimum width for mobile screens
-    'margin': 'auto',
-    'color': '#ffffff',        # Text color for dark aesthetic
-    'marginTop': '56px',       # Add margin to account for fixed navbar
-    'paddingTop': '20px'       # Additional padding for spacing
-}
-
 # Update the card style
 CARD_STYLE = {
     'height': '100%',
@@ -261,7 +298,7 @@ layout = dbc.Container([
         ], width='auto')
     ], justify='center', className='mt-4 mb-5')
 
-], fluid=True, style=CONTAINER_STYLE)
+], fluid=True, style=dict(CONTAINER_STYLE))
 
 # Load data
 cocoa_df, futures_df, daily_production = load_and_process_data()
@@ -291,149 +328,173 @@ COLORS = {
     'background': '#272b30'
 }
 
-# Callback for the main cocoa production and price graph
-@callback(
-    Output('cocoa-production-price-graph', 'figure'),
-    Input('cocoa-production-price-graph', 'id')
-)
-def update_cocoa_graph(_):
-    # Create figure with secondary y-axis
-    fig = go.Figure()
-
-    # Add production traces
-    fig.add_trace(
-        go.Scatter(
-            x=daily_production['date'],
-            y=daily_production['production'],
-            name='Actual Production',
-            yaxis='y1',
-            line=dict(
-                color=COLORS['production'],
-                width=GRAPH_STYLE['line_width']
-            )
-        )
-    )
-
-    fig.add_trace(
-        go.Scatter(
-            x=daily_production['date'],
-            y=daily_production['estimates'],
-            name='Projected Production',
-            yaxis='y1',
-            line=dict(
-                color=COLORS['estimates'],
-                width=GRAPH_STYLE['line_width'],
-                dash='dash'
-            )
-        )
-    )
-
-    # Add price traces
-    fig.add_trace(
-        go.Scatter(
-            x=futures_df['Date'],
-            y=futures_df['London futures (£ sterling/tonne)'],
-            name='London Futures',
-            yaxis='y2',
-            line=dict(
-                color=COLORS['london'],
-                width=GRAPH_STYLE['line_width']
-            )
+# Maximum number of points per trace sent to the browser
+MAX_TRACE_POINTS = 1000
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # The first and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+
+        # Keep the point forming the largest triangle with the previously kept
+        # point and the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
         )
+        a = start + int(areas.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+def downsample_series(dates, values, n_out=MAX_TRACE_POINTS):
+    """Return a date-sorted, LTTB-downsampled copy of a time series for plotting"""
+    series = pd.Series(values.to_numpy(), index=dates.to_numpy()).dropna().sort_index()
+    idx = lttb_indices(
+        series.index.to_numpy().astype('int64').astype(float),
+        series.to_numpy(dtype=float),
+        n_out
     )
+    return series.iloc[idx]
+
+def build_cocoa_figure():
+    """Build the main cocoa production and price figure"""
+    # Downsample the daily series; the browser cannot show more detail anyway
+    production = downsample_series(daily_production['date'], daily_production['production'])
+    estimates = downsample_series(daily_production['date'], daily_production['estimates'])
+    london = downsample_series(futures_df['Date'], futures_df['London futures (£ sterling/tonne)'])
+    ny = downsample_series(futures_df['Date'], futures_df['New York futures (US$/tonne)'])
+    icco = downsample_series(futures_df['Date'], futures_df['ICCO daily price (US$/tonne)'])
+
+    # Build the figure as plain dicts; Dash serializes them directly, which
+    # skips Plotly's per-property validation of every trace
+    data = [
+        {
+            'type': 'scatter',
+            'x': series.index,
+            'y': series.values,
+            'name': name,
+            'yaxis': yaxis,
+            'line': line
+        }
+        for series, name, yaxis, line in [
+            (production, 'Actual Production', 'y', {
+                'color': COLORS['production'],
+                'width': GRAPH_STYLE['line_width']
+            }),
+            (estimates, 'Projected Production', 'y', {
+                'color': COLORS['estimates'],
+                'width': GRAPH_STYLE['line_width'],
+                'dash': 'dash'
+            }),
+            (london, 'London Futures', 'y2', {
+                'color': COLORS['london'],
+                'width': GRAPH_STYLE['line_width']
+            }),
+            (ny, 'NY Futures', 'y2', {
+                'color': COLORS['ny'],
+                'width': GRAPH_STYLE['line_width']
+            }),
+            (icco, 'ICCO Daily Price', 'y2', {
+                'color': COLORS['icco'],
+                'width': GRAPH_STYLE['line_width']
+            })
+        ]
+    ]
 
-    fig.add_trace(
-        go.Scatter(
-            x=futures_df['Date'],
-            y=futures_df['New York futures (US$/tonne)'],
-            name='NY Futures',
-            yaxis='y2',
-            line=dict(
-                color=COLORS['ny'],
-                width=GRAPH_STYLE['line_width']
-            )
-        )
-    )
+    # Layout with responsive sizing
+    layout = {
+        'title': {
+            'text': 'Cocoa Production and Price Analysis',
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {
+                'size': GRAPH_STYLE['title_size']
+            }
+        },
+        'xaxis': {
+            'title': {'text': 'Date', 'font': {'size': GRAPH_STYLE['axis_title_size']}},
+            'rangeslider': {'visible': True},
+            'type': 'date',
+            'gridcolor': COLORS['grid'],
+            'gridwidth': GRAPH_STYLE['grid_width']
+        },
+        'yaxis': {
+            'title': {
+                'text': 'Production Volume (thousand tonnes)',
+                'font': {'size': GRAPH_STYLE['axis_title_size']}
+            },
+            'side': 'left',
+            'showgrid': True,
+            'gridcolor': COLORS['grid'],
+            'gridwidth': GRAPH_STYLE['grid_width']
+        },
+        'yaxis2': {
+            'title': {
+                'text': 'Price (US$/tonne, £/tonne)',
+                'font': {'size': GRAPH_STYLE['axis_title_size']}
+            },
+            'side': 'right',
+            'overlaying': 'y',
+            'showgrid': False
+        },
+        'hovermode': 'x unified',
+        'legend': {
+            'yanchor': 'top',
+            'y': 0.99,
+            'xanchor': 'left',
+            'x': 0.01,
+            'font': {
+                'size': GRAPH_STYLE['legend_font_size'],
+                'color': 'white'
+            },
+            'bgcolor': 'rgba(50, 50, 50, 0.9)',
+            'bordercolor': 'rgba(255, 255, 255, 0.3)'
+        },
+        'hoverlabel': {
+            'bgcolor': 'rgba(50, 50, 50, 0.9)',
+            'bordercolor': 'rgba(255, 255, 255, 0.3)',
+            'font': {
+                'size': GRAPH_STYLE['legend_font_size'],
+                'color': 'white'
+            }
+        },
+        'template': pio.templates['plotly_dark'],
+        'paper_bgcolor': COLORS['background'],
+        'font': {'color': '#ffffff'},
+        'margin': {'l': 50, 'r': 50, 't': 80, 'b': 50},  # Responsive margins
+        'height': 650,  # Base height
+        'autosize': True,  # Allow responsive resizing
+        'plot_bgcolor': COLORS['background']
+    }
 
-    fig.add_trace(
-        go.Scatter(
-            x=futures_df['Date'],
-            y=futures_df['ICCO daily price (US$/tonne)'],
-            name='ICCO Daily Price',
-            yaxis='y2',
-            line=dict(
-                color=COLORS['icco'],
-                width=GRAPH_STYLE['line_width']
-            )
-        )
-    )
+    return {'data': data, 'layout': layout}
 
-    # Update layout with responsive sizing
-    fig.update_layout(
-    title={
-        'text': 'Cocoa Production and Price Analysis',
-        'y': 0.95,
-        'x': 0.5,
-        'xanchor': 'center',
-        'yanchor': 'top',
-        'font': {
-            'size': GRAPH_STYLE['title_size']
-        }
-    },
-    xaxis=dict(
-        title='Date',
-        rangeslider=dict(visible=True),
-        type='date',
-        gridcolor=COLORS['grid'],
-        gridwidth=GRAPH_STYLE['grid_width'],
-        title_font=dict(size=GRAPH_STYLE['axis_title_size'])
-    ),
-    yaxis=dict(
-        title='Production Volume (thousand tonnes)',
-        side='left',
-        showgrid=True,
-        gridcolor=COLORS['grid'],
-        gridwidth=GRAPH_STYLE['grid_width'],
-        title_font=dict(size=GRAPH_STYLE['axis_title_size'])
-    ),
-    yaxis2=dict(
-        title='Price (US$/tonne, £/tonne)',
-        side='right',
-        overlaying='y',
-        showgrid=False,
-        title_font=dict(size=GRAPH_STYLE['axis_title_size'])
-    ),
-    hovermode='x unified',
-    legend=dict(
-        yanchor="top",
-        y=0.99,
-        xanchor="left",
-        x=0.01,
-        font=dict(
-            size=GRAPH_STYLE['legend_font_size'],
-            color='white'
-        ),
-        bgcolor='rgba(50, 50, 50, 0.9)',
-        bordercolor='rgba(255, 255, 255, 0.3)'
-    ),
-    hoverlabel=dict(
-        bgcolor='rgba(50, 50, 50, 0.9)',
-        bordercolor='rgba(255, 255, 255, 0.3)',
-        font=dict(
-            size=GRAPH_STYLE['legend_font_size'],
-            color='white'
-        )
-    ),
-    template='plotly_dark',
-    paper_bgcolor=COLORS['background'],
-    font=dict(color='#ffffff'),
-    margin=dict(l=50, r=50, t=80, b=50),  # Responsive margins
-    height=650,  # Base height
-    autosize=True,  # Allow responsive resizing
-    plot_bgcolor=COLORS['background']
-    )
+# The main figure only depends on data fixed at import, so build it once
+COCOA_FIGURE = build_cocoa_figure()
 
-    return fig
+# Callback for the main cocoa production and price graph
+@callback(
+    Output('cocoa-production-price-graph', 'figure'),
+    Input('cocoa-production-price-graph', 'id')
+)
+def update_cocoa_graph(_):
+    return COCOA_FIGURE
 
 # Style configurations for statistical analysis
 STAT_STYLES = {
@@ -466,36 +527,76 @@ def create_stat_item(label, value, additional_class=""):
         className=additional_class
     )
 
+# Statistics for the analysis cards; the source frames are fixed after
+# import, so they are computed once instead of in every callback
+
+# Merge production and price data
+merged_df = pd.merge_asof(
+    futures_df.sort_values('Date'),
+    daily_production.rename(columns={'date': 'Date'}).sort_values('Date'),
+    on='Date',
+    direction='nearest'
+)
+
+# Calculate correlations of production with each price in a single pass
+correlation_matrix = merged_df[[
+    'production',
+    'ICCO daily price (US$/tonne)',
+    'London futures (£ sterling/tonne)',
+    'New York futures (US$/tonne)'
+]].corr()
+
+CORRELATIONS = dict(zip(
+    ['Production vs ICCO Price', 'Production vs London', 'Production vs NY'],
+    correlation_matrix.iloc[0, 1:].tolist()
+))
+
+# Calculate production statistics on the raw arrays, skipping missing seasons
+production_values = cocoa_df['production'].to_numpy(dtype=float)
+estimate_values = cocoa_df['estimates'].to_numpy(dtype=float)
+
+PRODUCTION_STATS = {
+    'Average Production': {
+        'value': np.nanmean(production_values),
+        'format': '{:,.0f} tonnes'
+    },
+    'Growth Rate': {
+        'value': np.nanmean(np.diff(production_values) / production_values[:-1] * 100),
+        'format': '{:.1f}%'
+    },
+    'Estimate Accuracy': {
+        'value': np.nanmean(np.abs(production_values - estimate_values) / estimate_values * 100),
+        'format': '{:.1f}%'
+    }
+}
+
+# Calculate price statistics
+PRICE_STATS = {
+    'Average ICCO Price': {
+        'value': futures_df['ICCO daily price (US$/tonne)'].mean(),
+        'format': '${:,.0f}'
+    },
+    'Price Volatility': {
+        'value': (futures_df['ICCO daily price (US$/tonne)'].std() / 
+                 futures_df['ICCO daily price (US$/tonne)'].mean() * 100),
+        'format': '{:.1f}%'
+    },
+    'London-NY Spread': {
+        'value': (futures_df['London futures (£ sterling/tonne)'] - 
+                 futures_df['New York futures (US$/tonne)']).mean(),
+        'format': '${:,.0f}'
+    }
+}
+
 # Callbacks for statistical analysis
 @callback(
     Output('correlation-analysis', 'children'),
     Input('cocoa-production-price-graph', 'id')
 )
 def update_correlation_analysis(_):
-    # Merge production and price data
-    merged_df = pd.merge_asof(
-        futures_df.sort_values('Date'),
-        daily_production.rename(columns={'date': 'Date'}).sort_values('Date'),
-        on='Date',
-        direction='nearest'
-    )
-    
-    # Calculate correlations
-    correlations = {
-        'Production vs ICCO Price': merged_df['production'].corr(
-            merged_df['ICCO daily price (US$/tonne)']
-        ),
-        'Production vs London': merged_df['production'].corr(
-            merged_df['London futures (£ sterling/tonne)']
-        ),
-        'Production vs NY': merged_df['production'].corr(
-            merged_df['New York futures (US$/tonne)']
-        )
-    }
-    
     return html.Div([
         create_stat_item(k, f"{v:.2f}")
-        for k, v in correlations.items()
+        for k, v in CORRELATIONS.items()
     ], style=STAT_STYLES['container'])
 
 @callback(
@@ -503,29 +604,12 @@ def update_correlation_analysis(_):
     Input('cocoa-production-price-graph', 'id')
 )
 def update_production_analysis(_):
-    # Calculate production statistics
-    production_stats = {
-        'Average Production': {
-            'value': cocoa_df['production'].mean(),
-            'format': '{:,.0f} tonnes'
-        },
-        'Growth Rate': {
-            'value': (cocoa_df['production'].pct_change() * 100).mean(),
-            'format': '{:.1f}%'
-        },
-        'Estimate Accuracy': {
-            'value': (abs(cocoa_df['production'] - cocoa_df['estimates']) 
-                     / cocoa_df['estimates'] * 100).mean(),
-            'format': '{:.1f}%'
-        }
-    }
-    
     return html.Div([
         create_stat_item(
             label,
             stats['format'].format(stats['value'])
         )
-        for label, stats in production_stats.items()
+        for label, stats in PRODUCTION_STATS.items()
     ], style=STAT_STYLES['container'])
 
 @callback(
@@ -533,30 +617,12 @@ def update_production_analysis(_):
     Input('cocoa-production-price-graph', 'id')
 )
 def update_price_analysis(_):
-    # Calculate price statistics
-    price_stats = {
-        'Average ICCO Price': {
-            'value': futures_df['ICCO daily price (US$/tonne)'].mean(),
-            'format': '${:,.0f}'
-        },
-        'Price Volatility': {
-            'value': (futures_df['ICCO daily price (US$/tonne)'].std() / 
-                     futures_df['ICCO daily price (US$/tonne)'].mean() * 100),
-            'format': '{:.1f}%'
-        },
-        'London-NY Spread': {
-            'value': (futures_df['London futures (£ sterling/tonne)'] - 
-                     futures_df['New York futures (US$/tonne)']).mean(),
-            'format': '${:,.0f}'
-        }
-    }
-    
     return html.Div([
         create_stat_item(
             label,
             stats['format'].format(stats['value'])
         )
-        for label, stats in price_stats.items()
+        for label, stats in PRICE_STATS.items()
     ], style=STAT_STYLES['container'])
 
 # Style configurations for decomposition analysis
@@ -623,6 +689,28 @@ PRICE_MAPPINGS = {
     }
 }
 
+# Monthly average of every price series, resampled together over the shared dates
+MONTHLY_PRICES = futures_df.set_index('Date')[
+    [price_info['column'] for price_info in PRICE_MAPPINGS.values()]
+].resample('M').mean()
+
+def build_seasonal_decompositions():
+    """Compute the monthly prices and their seasonal decomposition for every price series"""
+    # statsmodels is only needed here, so keep it off the module import path
+    from statsmodels.tsa.seasonal import seasonal_decompose
+
+    decompositions = {}
+    for price_key, price_info in PRICE_MAPPINGS.items():
+        monthly_price = MONTHLY_PRICES[price_info['column']]
+        decompositions[price_key] = (
+            monthly_price,
+            seasonal_decompose(monthly_price.dropna(), period=12, extrapolate_trend=True)
+        )
+    return decompositions
+
+# futures_df is fixed after import, so the decompositions are computed once
+SEASONAL_DECOMPOSITIONS = build_seasonal_decompositions()
+
 # Callback for Seasonal Decomposition and Findings
 @callback(
     [Output('seasonal-decomposition-graph', 'figure'),
@@ -632,26 +720,19 @@ PRICE_MAPPINGS = {
 def update_seasonal_analysis(selected_price):
     price_info = PRICE_MAPPINGS[selected_price]
     
-    # Prepare monthly price data
-    monthly_price = futures_df.set_index('Date')[price_info['column']].resample('M').mean()
+    # Look up the precomputed monthly price data and decomposition
+    monthly_price, decomposition = SEASONAL_DECOMPOSITIONS[selected_price]
     
     # Create decomposition figure
-    fig = create_decomposition_figure(monthly_price, price_info)
+    fig = create_decomposition_figure(monthly_price, decomposition, price_info)
     
     # Calculate statistics and create findings component
-    findings = create_findings_component(monthly_price, price_info)
+    findings = create_findings_component(monthly_price, decomposition, price_info)
     
     return fig, findings
 
-def create_decomposition_figure(monthly_price, price_info):
+def create_decomposition_figure(monthly_price, decomposition, price_info):
     """Create the seasonal decomposition figure with responsive sizing"""
-    # Perform decomposition
-    decomposition = seasonal_decompose(
-        monthly_price.dropna(), 
-        period=12,
-        extrapolate_trend=True
-    )
-    
     # Create subplots with responsive spacing
     fig = sp.make_subplots(
         rows=4, cols=1,
@@ -673,19 +754,24 @@ def create_decomposition_figure(monthly_price, price_info):
         (decomposition.resid, 'Residual', DECOMP_STYLES['graph']['colors']['residual'])
     ]
     
-    for i, (data, name, color) in enumerate(components, 1):
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data.values,
-                name=name,
-                line=dict(
-                    color=color,
-                    width=DECOMP_STYLES['graph']['line_width']
-                )
-            ),
-            row=i, col=1
-        )
+    # Add all four traces in one call so the figure is validated once
+    fig.add_traces(
+        [
+            {
+                'type': 'scatter',
+                'x': data.index,
+                'y': data.values,
+                'name': name,
+                'line': {
+                    'color': color,
+                    'width': DECOMP_STYLES['graph']['line_width']
+                }
+            }
+            for data, name, color in components
+        ],
+        rows=list(range(1, len(components) + 1)),
+        cols=[1] * len(components)
+    )
     
     # Update layout with responsive sizing
     fig.update_layout(
@@ -733,14 +819,8 @@ def create_decomposition_figure(monthly_price, price_info):
     
     return fig
 
-def create_findings_component(monthly_price, price_info):
+def create_findings_component(monthly_price, decomposition, price_info):
     """Create the findings component with cards stacked vertically"""
-    decomposition = seasonal_decompose(
-        monthly_price.dropna(),
-        period=12,
-        extrapolate_trend=True
-    )
-    
     # Calculate statistics
     stats = calculate_statistics(monthly_price, decomposition, price_info)
     
@@ -758,10 +838,15 @@ def create_findings_component(monthly_price, price_info):
 
 def calculate_statistics(monthly_price, decomposition, price_info):
     """Calculate all statistics with proper formatting"""
-    seasonal_monthly = decomposition.seasonal.groupby(
-        decomposition.seasonal.index.month
-    ).mean()
-    
+    # Average seasonal effect per calendar month (index 0 is January)
+    months = decomposition.seasonal.index.month.to_numpy()
+    seasonal_monthly = (
+        np.bincount(months, weights=decomposition.seasonal.to_numpy(), minlength=13)[1:]
+        / np.bincount(months, minlength=13)[1:]
+    )
+    peak_month = int(np.argmax(seasonal_monthly))
+    lowest_month = int(np.argmin(seasonal_monthly))
+
     return {
         'seasonal': {
             'Seasonal Strength': {
@@ -769,12 +854,12 @@ def calculate_statistics(monthly_price, decomposition, price_info):
                 'description': "Percentage of price variation explained by seasonal patterns"
             },
             'Peak Month': {
-                'value': datetime.strptime(str(seasonal_monthly.idxmax()), '%m').strftime('%B'),
-                'description': f"Average effect: {price_info['currency']}{abs(seasonal_monthly.max()):,.0f}"
+                'value': calendar.month_name[peak_month + 1],
+                'description': f"Average effect: {price_info['currency']}{abs(seasonal_monthly[peak_month]):,.0f}"
             },
             'Lowest Month': {
-                'value': datetime.strptime(str(seasonal_monthly.idxmin()), '%m').strftime('%B'),
-                'description': f"Average effect: {price_info['currency']}{abs(seasonal_monthly.min()):,.0f}"
+                'value': calendar.month_name[lowest_month + 1],
+                'description': f"Average effect: {price_info['currency']}{abs(seasonal_monthly[lowest_month]):,.0f}"
             }
         },
         'price': {
@@ -819,75 +904,93 @@ def create_decomp_stat_item(label, value, description):
         )
     ], className='mb-3')
 
+# Resolution of the grid the price KDE is evaluated on
+KDE_GRID_SIZE = 256
+
+@lru_cache(maxsize=1)
+def compute_price_density():
+    """Compute the New York vs London price points and their KDE density, sorted by density"""
+    from scipy.signal import fftconvolve
+
+    # Reuse the already parsed futures data, dropping days missing either price
+    prices = futures_df[['New York futures (US$/tonne)', 'London futures (£ sterling/tonne)']].dropna()
+    x = prices.iloc[:, 0].to_numpy()
+    y = prices.iloc[:, 1].to_numpy()
+
+    # The density only colours the markers, so compute it in contiguous float32
+    # arrays; the plotted coordinates keep full precision
+    x32 = np.ascontiguousarray(x, dtype=np.float32)
+    y32 = np.ascontiguousarray(y, dtype=np.float32)
+
+    # Calculate point density on a grid: bin the points and convolve the counts
+    # with a Gaussian kernel through the FFT, which costs O(N + G log G)
+    # instead of evaluating N kernels at N points
+    counts, x_edges, y_edges = np.histogram2d(x32, y32, bins=KDE_GRID_SIZE)
+    counts = counts.astype(np.float32)
+    x_edges = x_edges.astype(np.float32)
+    y_edges = y_edges.astype(np.float32)
+    dx = x_edges[1] - x_edges[0]
+    dy = y_edges[1] - y_edges[0]
+
+    # Scott's rule bandwidth on the full covariance, as scipy's gaussian_kde uses
+    cov = np.cov(x32, y32) * len(x) ** (-1 / 3)
+    inv_cov = np.linalg.inv(cov)
+    kx = min(int(np.ceil(4 * np.sqrt(cov[0, 0]) / dx)), KDE_GRID_SIZE)
+    ky = min(int(np.ceil(4 * np.sqrt(cov[1, 1]) / dy)), KDE_GRID_SIZE)
+    gx, gy = np.meshgrid(
+        np.arange(-kx, kx + 1) * dx,
+        np.arange(-ky, ky + 1) * dy,
+        indexing='ij'
+    )
+    kernel = np.exp(-0.5 * (
+        inv_cov[0, 0] * gx ** 2
+        + 2 * inv_cov[0, 1] * gx * gy
+        + inv_cov[1, 1] * gy ** 2
+    ))
+    kernel = (kernel / kernel.sum()).astype(np.float32)
+
+    density = np.maximum(fftconvolve(counts, kernel, mode='same'), 0) / (len(x) * dx * dy)
+
+    # Look up each point's density in its grid cell
+    ix = np.clip(np.searchsorted(x_edges, x32, side='right') - 1, 0, KDE_GRID_SIZE - 1)
+    iy = np.clip(np.searchsorted(y_edges, y32, side='right') - 1, 0, KDE_GRID_SIZE - 1)
+    z = density[ix, iy]
+
+    # Sort the points by density
+    idx = z.argsort()
+    return x[idx], y[idx], z[idx]
+
 # Callback for Price Scatter Plot with KDE
 @callback(
     Output('price-scatter-kde', 'figure'),
     Input('price-selector', 'value')
 )
 def update_price_scatter_kde(selected_price):
-    import pandas as pd
-    import plotly.graph_objects as go
-    import numpy as np
-    from scipy.stats import gaussian_kde
-
-    DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-    # Load the price data
-    price_data = pd.read_csv(os.path.join(DATA_DIR, 'Daily Prices.csv'))  # Update with your actual data file
-
-    # Sort the DataFrame by date
-    price_data_sorted = price_data.sort_values('Date')
-
-    # Extract x and y data using the correct column names
-    x = price_data_sorted['New York futures (US$/tonne)']
-    y = price_data_sorted['London futures (£ sterling/tonne)']
-
-    # Convert x and y to numeric, coercing errors to NaN
-    x = pd.to_numeric(x, errors='coerce')
-    y = pd.to_numeric(y, errors='coerce')
-
-    # Remove any NaN values
-    valid_idx = x.notna() & y.notna()
-    x = x[valid_idx]
-    y = y[valid_idx]
-
-    # Convert to numpy arrays
-    x = x.values
-    y = y.values
-
-    # Calculate point density
-    xy = np.vstack([x, y])
-    z = gaussian_kde(xy)(xy)
-
-    # Sort the points by density
-    idx = z.argsort()
-    x, y, z = x[idx], y[idx], z[idx]
-
-    # Create scatter plot
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Scatter(
-            x=x,
-            y=y,
-            mode='markers',
-            name='Price Data',
-            marker=dict(
-                size=5,
-                color=z,
-                colorscale='Viridis',
-                showscale=True,
-                colorbar=dict(title='Density')
-            )
-        )
-    )
+    # The scatter does not depend on the selected price, so it is computed once
+    x, y, z = compute_price_density()
+
+    # Create scatter plot as a plain dict figure, skipping Plotly's validation
+    data = [{
+        'type': 'scatter',
+        'x': x,
+        'y': y,
+        'mode': 'markers',
+        'name': 'Price Data',
+        'marker': {
+            'size': 5,
+            'color': z,
+            'colorscale': 'Viridis',
+            'showscale': True,
+            'colorbar': {'title': {'text': 'Density'}}
+        }
+    }]
 
-    # Update layout
-    fig.update_layout(
-        height=400,
-        showlegend=False,
-        margin=dict(l=50, r=20, t=40, b=50),
-        template='plotly_dark',
-        title={
+    layout = {
+        'height': 400,
+        'showlegend': False,
+        'margin': {'l': 50, 'r': 20, 't': 40, 'b': 50},
+        'template': pio.templates['plotly_dark'],
+        'title': {
             'text': 'Scatter Plot of New York vs London Futures Prices with KDE',
             'y': 0.95,
             'x': 0.5,
@@ -895,17 +998,17 @@ def update_price_scatter_kde(selected_price):
             'yanchor': 'top',
             'font': {'size': 14}
         },
-        xaxis=dict(
-            title='New York Futures Price (US$/tonne)',
-            title_font={'size': 12},
-            tickfont={'size': 10}
-        ),
-        yaxis=dict(
-            title='London Futures Price (£ sterling/tonne)',
-            title_font={'size': 12},
-            tickfont={'size': 10}
-        )
-    )
+        'xaxis': {
+            'title': {'text': 'New York Futures Price (US$/tonne)', 'font': {'size': 12}},
+            'tickfont': {'size': 10}
+        },
+        'yaxis': {
+            'title': {'text': 'London Futures Price (£ sterling/tonne)', 'font': {'size': 12}},
+            'tickfont': {'size': 10}
+        }
+    }
+
+    fig = {'data': data, 'layout': layout}
 
     return fig
     
\ No newline at end of file
@@ -1,27 +1,34 @@
 import dash
 from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
-import plotly.express as px
 import plotly.graph_objects as go
 import json
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import geopandas as gpd
 import numpy as np
+import pickle
+import shapely
+from shapely.geometry import shape
+from pages._cache import CACHE_DIR, cache_is_fresh, write_cache_file
+from pages._style import CONTAINER_STYLE, DARK_CARD_TEMPLATE
+
+# orjson parses the GeoJSON files several times faster; fall back to the stdlib parser
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
+logger = logging.getLogger(__name__)
 
 # Register the page
 dash.register_page(__name__, path='/page1')
 
-# Container style configurations
-CONTAINER_STYLE = {
-    'maxWidth': '2000px',      # Maximum width for very large screens
-    'minWidth': '320px',       # Minimum width for mobile screens
-    'margin': 'auto',
-    'color': '#ffffff',        # Text color for dark aesthetic
-    'marginTop': '56px',       # Add margin to account for fixed navbar
-    'paddingTop': '20px'       # Additional padding for spacing
-}
-
 # Define the layout for the page
 layout = dbc.Container([
     # Header Section
@@ -148,40 +155,132 @@ layout = dbc.Container([
             ])
         ], width=12, className='mb-4')
     ]),
-], fluid=True, style=CONTAINER_STYLE)
-
-
-# Load GeoJSON datasets
-def load_geojson_data():
-    """Load all GeoJSON datasets into a dictionary."""
-    data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'cote-divoire'))
-    
-    datasets = {}
-
-    # List of files to load
-    file_names = [
-        'cote-divoire-cocoa-area-2021.geojson',
-        'cote-divoire-cocoa-deforestation-15-years-total-2021.geojson',
-        'cote-divoire-cocoa-tn-2021.geojson',
-        'cote-divoire-cocoa-yield-2021.geojson',
-        'cote-divoire-zdc-traded-cote-divoire-cocoa-perc-2021.geojson'
-    ]
+], fluid=True, style=dict(CONTAINER_STYLE))
+
 
-    # Load each file
-    for file_name in file_names:
-        file_path = os.path.join(data_dir, file_name)
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    dataset_name = file_name.replace('.geojson', '')
-                    datasets[dataset_name] = json.load(f)
-            except json.JSONDecodeError as e:
-                print(f"Error loading {file_name}: {e}")
-        else:
-            print(f"File not found: {file_name}")
-    return datasets
-
-geojson_datasets = load_geojson_data()
+def build_timeseries_frame(features):
+    """Flatten the feature timeseries into one row per feature and year."""
+    # Entries without a value become NaN, which the statistics skip
+    records = [
+        (feature_idx, feature['properties'].get('name'), entry['year'], entry.get('numerical_value', np.nan))
+        for feature_idx, feature in enumerate(features)
+        for entry in feature['properties'].get('timeseries', [])
+    ]
+    return pd.DataFrame.from_records(records, columns=['feature_idx', 'name', 'year', 'numerical_value'])
+
+# Geometry simplification tolerance in degrees (about 500 m at this latitude)
+SIMPLIFY_TOLERANCE = 0.005
+
+def build_plotly_geojson(features):
+    """Serialize the feature geometries into a FeatureCollection keyed by feature index."""
+    geoms = gpd.GeoSeries([
+        shape(feature['geometry']) if feature.get('geometry') else None
+        for feature in features
+    ])
+
+    # Department outlines do not need survey-grade detail on the map; simplifying
+    # them once cuts the vertices shipped to the browser on every update
+    geoms = geoms.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+
+    # shapely.to_geojson serializes all geometries in one vectorized call;
+    # features without a geometry are left out so the map simply skips them
+    return {
+        'type': 'FeatureCollection',
+        'features': [
+            {'type': 'Feature', 'id': feature_idx, 'geometry': loads_json(geometry)}
+            for feature_idx, geometry in enumerate(shapely.to_geojson(geoms.to_numpy()))
+            if geometry is not None
+        ]
+    }
+
+def load_plotly_geojson(file_path, features):
+    """Load the Plotly-ready FeatureCollection from the disk cache, rebuilding it when stale."""
+    cache_path = os.path.join(CACHE_DIR, os.path.basename(file_path).replace('.geojson', '.pickle'))
+
+    # This module is a source too, so edits to the serialization invalidate the cache;
+    # an unreadable cache is only a miss and gets rebuilt below
+    if cache_is_fresh([cache_path], [file_path, __file__]):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Ignoring unreadable GeoJSON cache %s: %s", cache_path, e)
+
+    plotly_geojson = build_plotly_geojson(features)
+
+    def dump(path):
+        with open(path, 'wb') as f:
+            pickle.dump(plotly_geojson, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    try:
+        write_cache_file(cache_path, dump)
+    except OSError as e:
+        logger.warning("Could not write GeoJSON cache: %s", e)
+    return plotly_geojson
+
+# GeoJSON datasets, named after their files in data/cote-divoire
+GEOJSON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'cote-divoire'))
+DATASET_NAMES = [
+    'cote-divoire-cocoa-area-2021',
+    'cote-divoire-cocoa-deforestation-15-years-total-2021',
+    'cote-divoire-cocoa-tn-2021',
+    'cote-divoire-cocoa-yield-2021',
+    'cote-divoire-zdc-traded-cote-divoire-cocoa-perc-2021'
+]
+
+# lru_cache does not stop two threads from loading the same dataset at once,
+# so the warm-up and an early callback serialize on a per-dataset lock
+DATASET_LOCKS = {name: threading.Lock() for name in DATASET_NAMES}
+
+def get_dataset(dataset_name):
+    """Return one loaded GeoJSON dataset, loading it at most once."""
+    with DATASET_LOCKS[dataset_name]:
+        return load_dataset(dataset_name)
+
+@lru_cache(maxsize=None)
+def load_dataset(dataset_name):
+    """Load and index one GeoJSON dataset, or return None if it cannot be read."""
+    file_name = dataset_name + '.geojson'
+    file_path = os.path.join(GEOJSON_DIR, file_name)
+    if not os.path.exists(file_path):
+        logger.error("File not found: %s", file_name)
+        return None
+
+    try:
+        with open(file_path, 'rb') as f:
+            geojson_data = loads_json(f.read())
+    except json.JSONDecodeError as e:
+        logger.error("Error loading %s: %s", file_name, e)
+        return None
+
+    df = build_timeseries_frame(geojson_data['features'])
+    plotly_geojson = load_plotly_geojson(file_path, geojson_data['features'])
+    rows_by_year = {int(year): rows for year, rows in df.groupby('year').indices.items()}
+    available_years = sorted(rows_by_year)
+    return {
+        'df': df,
+        'plotly_geojson': plotly_geojson,
+        # Index the rows and geometries so a year selection is a plain lookup
+        'rows_by_year': rows_by_year,
+        'features_by_idx': {feature['id']: feature for feature in plotly_geojson['features']},
+        # The year dropdown for this dataset, defaulting to the most recent year
+        'year_options': [{'label': str(year), 'value': year} for year in available_years],
+        'default_year': available_years[-1] if available_years else None
+    }
+
+# Load the datasets in the background instead of blocking the import; a
+# selection made before its dataset is ready simply loads it on demand
+def warm_dataset(dataset_name):
+    """Load one dataset in the background, logging failures the executor would drop."""
+    try:
+        get_dataset(dataset_name)
+    except Exception:
+        logger.exception("Error warming dataset %s", dataset_name)
+
+dataset_loader = ThreadPoolExecutor(max_workers=4)
+for name in DATASET_NAMES:
+    dataset_loader.submit(warm_dataset, name)
+dataset_loader.shutdown(wait=False)
 
 @callback(
     [Output('year-selector', 'options'),
@@ -189,32 +288,14 @@ geojson_datasets = load_geojson_data()
     [Input('geojson-selector', 'value')]
 )
 def update_year_selector(selected_dataset):
-    if selected_dataset not in geojson_datasets:
+    dataset = get_dataset(selected_dataset) if selected_dataset in DATASET_NAMES else None
+    if dataset is None:
         return [], None
 
-    # Get the selected GeoJSON data
-    geojson_data = geojson_datasets[selected_dataset]
-
-    # Extract year information from 'timeseries' field in properties
-    years_set = set()
-    for feature in geojson_data['features']:
-        timeseries = feature['properties'].get('timeseries', [])
-        for entry in timeseries:
-            if 'year' in entry:
-                years_set.add(entry['year'])
-
-    available_years = sorted(list(years_set))
-
-    # Debug: Print available years for verification
-    print(f"Available years for {selected_dataset}: {available_years}")
-
-    # Set default year to the most recent one if available
-    default_year = available_years[-1] if available_years else None
-
-    # Prepare options for the year dropdown
-    year_options = [{'label': str(year), 'value': year} for year in available_years]
-
-    return year_options, default_year
+    # The dropdown options are prebuilt per dataset at load
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Available years for %s: %s", selected_dataset, [option['value'] for option in dataset['year_options']])
+    return dataset['year_options'], dataset['default_year']
 
 @callback(
     [Output('geojson-map', 'figure'),
@@ -227,51 +308,64 @@ def update_year_selector(selected_dataset):
      Input('year-selector', 'value')]
 )
 def update_map(selected_dataset, selected_year):
-    if selected_dataset not in geojson_datasets:
-        return px.scatter_mapbox(), "No data available", "No data available", go.Figure(), go.Figure(), "No data available"
-
-    # Get the selected GeoJSON data
-    geojson_data = geojson_datasets[selected_dataset]
-
-    # Filter features by selected year if available
-    features = [
-        feature for feature in geojson_data['features']
-        if any(entry['year'] == selected_year for entry in feature['properties'].get('timeseries', []))
-    ]
-
-    # Create a filtered GeoJSON object
-    filtered_geojson = {"type": "FeatureCollection", "features": features}
-
-    # Load GeoJSON as a GeoDataFrame
-    gdf = gpd.GeoDataFrame.from_features(filtered_geojson['features'])
-
-    # Ensure 'numerical_value' is a valid column; assign dummy values if missing
-    if 'numerical_value' not in gdf.columns:
-        gdf['numerical_value'] = np.random.randint(10, 100, len(gdf))
-
-    # Create a choropleth map using Plotly Express
-    fig = px.choropleth(
-        gdf,
-        geojson=gdf.geometry,
-        locations=gdf.index,
-        color='numerical_value',
-        hover_name='name',
-        title="Côte d'Ivoire Cocoa Production Areas"
-    )
-
-    fig.update_geos(fitbounds="locations", visible=False, bgcolor='#272b30')
-    fig.update_layout(
-        margin={"r": 0, "t": 30, "l": 0, "b": 0},
-        plot_bgcolor='#272b30',
-        paper_bgcolor='#272b30',
-        font=dict(color='#ffffff')
-    )
+    if selected_dataset not in DATASET_NAMES or get_dataset(selected_dataset) is None:
+        return go.Figure(), "No data available", "No data available", go.Figure(), go.Figure(), "No data available"
+
+    # Users switch back and forth between the same selections, so reuse the outputs
+    return _compute_outputs(selected_dataset, selected_year)
+
+@lru_cache(maxsize=64)
+def _compute_outputs(selected_dataset, selected_year):
+    """Build the map, statistics and charts for one dataset and year."""
+    # Get the selected dataset's timeseries rows and serialized geometries
+    dataset = get_dataset(selected_dataset)
+    df = dataset['df']
+
+    # Look up the rows of the features that have a value for the selected year
+    year_rows = dataset['rows_by_year'].get(selected_year, [])
+    year_df = df.iloc[year_rows].set_index('feature_idx')
+
+    # Only ship the geometries of the features shown for this year
+    features_by_idx = dataset['features_by_idx']
+    year_geojson = {
+        'type': 'FeatureCollection',
+        'features': [features_by_idx[i] for i in year_df.index if i in features_by_idx]
+    }
+
+    # Create a WebGL choropleth on a dark tile map centred on Côte d'Ivoire. The
+    # figure is a plain dict that references the cached geometries, so they are
+    # neither validated nor deep-copied on every call
+    fig = {
+        'data': [{
+            'type': 'choroplethmapbox',
+            'geojson': year_geojson,
+            'locations': year_df.index.to_numpy(),
+            'z': year_df['numerical_value'].to_numpy(),
+            'hovertext': year_df['name'].to_numpy(),
+            'hovertemplate': '<b>%{hovertext}</b><br><br>feature_idx=%{location}<br>numerical_value=%{z}<extra></extra>',
+            'coloraxis': 'coloraxis',
+            'name': ''
+        }],
+        'layout': {
+            'template': DARK_CARD_TEMPLATE,
+            'mapbox': {'center': {'lat': 7.5, 'lon': -5.5}, 'zoom': 6, 'style': 'carto-darkmatter'},
+            'coloraxis': {
+                'colorbar': {'title': {'text': 'numerical_value'}},
+                'colorscale': DARK_CARD_TEMPLATE.layout.colorscale.sequential
+            },
+            'title': {'text': "Côte d'Ivoire Cocoa Production Areas"},
+            'margin': {'r': 0, 't': 30, 'l': 0, 'b': 0}
+        }
+    }
 
     # Descriptive Statistics
-    if not gdf.empty:
-        mean_value = gdf['numerical_value'].mean()
-        median_value = gdf['numerical_value'].median()
-        std_dev = gdf['numerical_value'].std()
+    # Work on the raw values; the nan-aware reductions skip missing entries like pandas does
+    values = year_df['numerical_value'].to_numpy()
+    # A year whose values are all missing has nothing to summarize, same as an empty one
+    if not np.isnan(values).all():
+        mean_value = np.nanmean(values)
+        median_value = np.nanmedian(values)
+        std_dev = np.nanstd(values, ddof=1)
         descriptive_stats = html.Div([
             html.P(f"Mean Value: {mean_value:.2f}"),
             html.P(f"Median Value: {median_value:.2f}"),
@@ -279,45 +373,68 @@ def update_map(selected_dataset, selected_year):
         ])
 
         # Top and Bottom Regions
-        top_region = gdf.loc[gdf['numerical_value'].idxmax()]
-        bottom_region = gdf.loc[gdf['numerical_value'].idxmin()]
+        top_region = year_df.iloc[np.nanargmax(values)]
+        bottom_region = year_df.iloc[np.nanargmin(values)]
         top_bottom_regions = html.Div([
             html.P(f"Top Region: {top_region['name']} with value {top_region['numerical_value']:.2f}"),
             html.P(f"Bottom Region: {bottom_region['name']} with value {bottom_region['numerical_value']:.2f}")
         ])
 
-        # Time Series Analysis
-        timeseries_fig = go.Figure()
-        for feature in features:
-            timeseries = feature['properties'].get('timeseries', [])
-            years = [entry['year'] for entry in timeseries]
-            values = [entry['numerical_value'] for entry in timeseries]
-            timeseries_fig.add_trace(go.Scatter(x=years, y=values, mode='lines+markers', name=feature['properties']['name']))
-        timeseries_fig.update_layout(
-            paper_bgcolor='#272b30',
-            plot_bgcolor='#272b30',
-            font=dict(color='#ffffff'),
-            title="Time Series of Selected Regions"
-        )
-
-        # Statistical Distribution
-        distribution_fig = px.histogram(gdf, x='numerical_value', nbins=20, title="Statistical Distribution of Numerical Values")
-        distribution_fig.update_layout(
-            paper_bgcolor='#272b30',
-            plot_bgcolor='#272b30',
-            font=dict(color='#ffffff')
-        )
+        # Time Series Analysis, one line per region. The traces are plain dicts
+        # sliced from the column arrays; Dash serializes them directly, which
+        # skips Plotly's per-property validation of every trace
+        selected_rows = df[df['feature_idx'].isin(year_df.index)]
+        years = selected_rows['year'].to_numpy()
+        values_by_year = selected_rows['numerical_value'].to_numpy()
+        names = selected_rows['name'].to_numpy()
+        timeseries_fig = {
+            'data': [
+                {
+                    'type': 'scatter',
+                    'mode': 'lines+markers',
+                    'x': years[rows],
+                    'y': values_by_year[rows],
+                    'name': names[rows[0]]
+                }
+                for rows in selected_rows.groupby('feature_idx', sort=False).indices.values()
+            ],
+            'layout': {
+                'template': DARK_CARD_TEMPLATE,
+                'title': {'text': "Time Series of Selected Regions"}
+            }
+        }
+
+        # Statistical Distribution, binned here into 20 equal-width bins and drawn as bars
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=20)
+        distribution_fig = {
+            'data': [{
+                'type': 'bar',
+                'x': (edges[:-1] + edges[1:]) / 2,
+                'y': counts,
+                'width': np.diff(edges),
+                'hovertemplate': 'numerical_value=%{x}<br>count=%{y}<extra></extra>'
+            }],
+            'layout': {
+                'template': DARK_CARD_TEMPLATE,
+                'title': {'text': "Statistical Distribution of Numerical Values"},
+                'xaxis': {'title': {'text': 'numerical_value'}},
+                'yaxis': {'title': {'text': 'count'}},
+                'bargap': 0
+            }
+        }
 
         # Regional Insights
-        total_regions = len(gdf)
+        total_regions = len(year_df)
         regional_insights = html.Div([
             html.P(f"Total Number of Regions: {total_regions}")
         ])
     else:
         descriptive_stats = "No data available"
         top_bottom_regions = "No data available"
-        timeseries_fig = go.Figure()
-        distribution_fig = go.Figure()
+        timeseries_fig = go.Figure().to_dict()
+        distribution_fig = go.Figure().to_dict()
         regional_insights = "No data available"
 
-    return fig, descriptive_stats, top_bottom_regions, timeseries_fig, distribution_fig, regional_insights
\ No newline at end of file
+    # Return the figures as plain dicts so serializing a cached result never touches a shared Figure
+    return (fig, descriptive_stats, top_bottom_regions,
+            timeseries_fig, distribution_fig, regional_insights)
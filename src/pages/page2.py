@@ -6,7 +6,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import os
-from dash import callback, Input, Output
+from pages._style import CONTAINER_STYLE
 
 # Register the page
 dash.register_page(__name__)
@@ -15,86 +15,29 @@ dash.register_page(__name__)
 data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
 file_path = os.path.join(data_dir, '2024 consumption.csv')
 
-# Load and process the data
-df = pd.read_csv(file_path)
+# Load only the columns the charts use, with their types given up front
+df = pd.read_csv(
+    file_path,
+    usecols=[
+        'country',
+        'WhichCountryEatsTheMostChocolate_ChocolateProductsNESConsumed_Tonnes_2022',
+        'WhichCountryEatsTheMostChocolate_ConsumptionPerCap_GramsPerCapPerDay_2022'
+    ],
+    dtype={
+        'country': 'category',
+        'WhichCountryEatsTheMostChocolate_ChocolateProductsNESConsumed_Tonnes_2022': 'float64',
+        'WhichCountryEatsTheMostChocolate_ConsumptionPerCap_GramsPerCapPerDay_2022': 'float64'
+    }
+)
 
 # Clean column names for easier handling
-df.columns = df.columns.str.replace('WhichCountryEatsTheMostChocolate_', '')
-df.columns = df.columns.str.replace('_2022', '')
-
-# Container style configurations
-CONTAINER_STYLE = {
-    'maxWidth': '2000px',      # Maximum width for very large screens
-    'minWidth': '320px',       # Minimum width for mobile screens
-    'margin': 'auto',
-    'color': '#ffffff',        # Text color for dark aesthetic
-    'marginTop': '56px',       # Add margin to account for fixed navbar
-    'paddingTop': '20px'       # Additional padding for spacing
-}
-
-# Layout with dark aesthetic styling
-layout = dbc.Container([
-    # Header Section
-    dbc.Row([
-        dbc.Col(
-            html.H1("Global Chocolate Consumption Analysis", 
-                   className='text-center text-primary my-4',
-                   style={'fontSize': 'calc(1.5rem + 1.5vw)'}),
-            width=12
-        )
-    ]),
-
-    # Description Section
-    dbc.Row([
-        dbc.Col([
-            html.P("2022 data on global chocolate consumption was analyzed to identify the top consumers by total consumption and daily per capita consumption. The top 15 countries by each metric are displayed in the charts below. The scatter plot shows the relationship between total and per capita consumption for all countries in the dataset.",
-                   className='text-center mb-4',
-                   style={'fontSize': 'calc(0.9rem + 0.5vw)'})
-        ], width=12)
-    ]),
-    
-    # Row 1: Top consumers charts
-    dbc.Row([
-        # Total consumption chart
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Top 15 Countries by Total Chocolate Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
-                dbc.CardBody(
-                    dcc.Graph(id='total-consumption-chart')
-                )
-            ], style={'backgroundColor': '#272b30'})
-        ], width=12, lg=6, className="mb-4"),
-        
-        # Per capita consumption chart
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Top 15 Countries by Daily Per Capita Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
-                dbc.CardBody(
-                    dcc.Graph(id='per-capita-chart')
-                )
-            ], style={'backgroundColor': '#272b30'})
-        ], width=12, lg=6, className="mb-4"),
-    ]),
-    
-    # Row 2: Scatter plot
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardHeader("Total vs Per Capita Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
-                dbc.CardBody(
-                    dcc.Graph(id='scatter-plot')
-                )
-            ], style={'backgroundColor': '#272b30'})
-        ], width=12, className="mb-4")
-    ])
-], fluid=True, style=CONTAINER_STYLE)
+df = df.rename(columns={
+    column: column.replace('WhichCountryEatsTheMostChocolate_', '').replace('_2022', '')
+    for column in df.columns
+})
 
-# Callbacks to update the graphs
-@callback(
-    Output('total-consumption-chart', 'figure'),
-    Input('total-consumption-chart', 'id')
-)
-def update_total_consumption(dummy):
+def build_total_consumption_figure():
+    """Build the bar chart of the top 15 countries by total consumption"""
     # Get top 15 total consumers
     top_total = df.nlargest(15, 'ChocolateProductsNESConsumed_Tonnes')
     
@@ -111,18 +54,13 @@ def update_total_consumption(dummy):
         yaxis={'categoryorder': 'total ascending'},
         height=600,
         margin=dict(l=20, r=20, t=20, b=20),
-        paper_bgcolor='#272b30',  # Background to match the dark aesthetic
-        plot_bgcolor='#272b30',
-        font=dict(color='#ffffff')  # White font for visibility
+        template='dark_card'  # Dark card background and white font, from pages._style
     )
     
     return fig
 
-@callback(
-    Output('per-capita-chart', 'figure'),
-    Input('per-capita-chart', 'id')
-)
-def update_per_capita(dummy):
+def build_per_capita_figure():
+    """Build the bar chart of the top 15 countries by per capita consumption"""
     # Get top 15 per capita consumers
     top_capita = df.nlargest(15, 'ConsumptionPerCap_GramsPerCapPerDay')
     
@@ -139,18 +77,13 @@ def update_per_capita(dummy):
         yaxis={'categoryorder': 'total ascending'},
         height=600,
         margin=dict(l=20, r=20, t=20, b=20),
-        paper_bgcolor='#272b30',  # Background to match the dark aesthetic
-        plot_bgcolor='#272b30',
-        font=dict(color='#ffffff')  # White font for visibility
+        template='dark_card'  # Dark card background and white font, from pages._style
     )
     
     return fig
 
-@callback(
-    Output('scatter-plot', 'figure'),
-    Input('scatter-plot', 'id')
-)
-def update_scatter(dummy):
+def build_scatter_figure():
+    """Build the scatter plot of total against per capita consumption"""
     fig = px.scatter(
         df,
         x='ChocolateProductsNESConsumed_Tonnes',
@@ -175,9 +108,69 @@ def update_scatter(dummy):
     fig.update_layout(
         height=600,
         margin=dict(l=20, r=20, t=20, b=20),
-        paper_bgcolor='#272b30',  # Background to match the dark aesthetic
-        plot_bgcolor='#272b30',
-        font=dict(color='#ffffff')  # White font for visibility
+        template='dark_card'  # Dark card background and white font, from pages._style
     )
     
     return fig
+
+# The data never changes while the app runs, so the figures are built once at import
+TOTAL_CONSUMPTION_FIGURE = build_total_consumption_figure()
+PER_CAPITA_FIGURE = build_per_capita_figure()
+SCATTER_FIGURE = build_scatter_figure()
+
+# Layout with dark aesthetic styling
+layout = dbc.Container([
+    # Header Section
+    dbc.Row([
+        dbc.Col(
+            html.H1("Global Chocolate Consumption Analysis", 
+                   className='text-center text-primary my-4',
+                   style={'fontSize': 'calc(1.5rem + 1.5vw)'}),
+            width=12
+        )
+    ]),
+
+    # Description Section
+    dbc.Row([
+        dbc.Col([
+            html.P("2022 data on global chocolate consumption was analyzed to identify the top consumers by total consumption and daily per capita consumption. The top 15 countries by each metric are displayed in the charts below. The scatter plot shows the relationship between total and per capita consumption for all countries in the dataset.",
+                   className='text-center mb-4',
+                   style={'fontSize': 'calc(0.9rem + 0.5vw)'})
+        ], width=12)
+    ]),
+    
+    # Row 1: Top consumers charts
+    dbc.Row([
+        # Total consumption chart
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Top 15 Countries by Total Chocolate Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
+                dbc.CardBody(
+                    dcc.Graph(id='total-consumption-chart', figure=TOTAL_CONSUMPTION_FIGURE)
+                )
+            ], style={'backgroundColor': '#272b30'})
+        ], width=12, lg=6, className="mb-4"),
+        
+        # Per capita consumption chart
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Top 15 Countries by Daily Per Capita Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
+                dbc.CardBody(
+                    dcc.Graph(id='per-capita-chart', figure=PER_CAPITA_FIGURE)
+                )
+            ], style={'backgroundColor': '#272b30'})
+        ], width=12, lg=6, className="mb-4"),
+    ]),
+    
+    # Row 2: Scatter plot
+    dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Total vs Per Capita Consumption", style={'color': '#ffffff', 'backgroundColor': '#272b30'}),
+                dbc.CardBody(
+                    dcc.Graph(id='scatter-plot', figure=SCATTER_FIGURE)
+                )
+            ], style={'backgroundColor': '#272b30'})
+        ], width=12, className="mb-4")
+    ])
+], fluid=True, style=dict(CONTAINER_STYLE))